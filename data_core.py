@@ -6,145 +6,226 @@ Simple interface for data-core operations.
 
 import sys
 import os
-import subprocess
+import importlib
 
-def save_chat():
+# Process scripts, resolved once relative to this file
+HERE = os.path.dirname(os.path.abspath(__file__))
+VALIDATE_MEMORY_SCRIPT = os.path.join(HERE, "processes", "chats", "validate_memory.py")
+HEALTH_CHECK_SCRIPT = os.path.join(HERE, "processes", "chats", "chat_health_check.py")
+
+# Set by --subprocess: run process scripts in a separate interpreter
+USE_SUBPROCESS = False
+
+# Command banners, each written with a single call
+BAR = "=" * 60
+SAVE_BANNER = (
+    "Note: Save process replaced with real-time value capture. See MEMORY.md for details.\n"
+    f"{BAR}\nDATA CORE - REAL-TIME VALUE CAPTURE SYSTEM\n{BAR}\n"
+    "The save process has been replaced with real-time value capture.\n"
+    "AI automatically creates chat records when valuable content is identified.\n"
+    "\nNo manual save process needed - system operates automatically.\n"
+    "See MEMORY.md and chats/system/framework.md for details.\n"
+)
+VALIDATE_BANNER = (
+    f"{BAR}\nDATA CORE - MEMORY VALIDATION PROCESS\n{BAR}\n"
+    "Validates chat memory files for format compliance and gapless history.\n"
+    "Ensures zero information loss and perfect conversation continuity.\n"
+    "\nStarting memory validation process...\n"
+)
+HEALTH_BANNER = (
+    f"{BAR}\nDATA CORE - AI-FIRST HEALTH CHECK PROCESS\n{BAR}\n"
+    "Comprehensive chat system health monitoring with proactive issue detection.\n"
+    "Zero manual intervention required - designed for AI systems.\n"
+    "\nStarting AI-first health check process...\n"
+)
+COMMIT_BANNER = (
+    f"{BAR}\nDATA CORE - GIT COMMIT PROCESS\n{BAR}\n"
+    "Git commit functionality has been temporarily removed.\n"
+    "Use standard git commands for now: git add, git commit, git push\n"
+    "\nThis will be reimplemented when the new system architecture is ready.\n"
+)
+
+def exit_status(result):
+    """Map a process main() return value or SystemExit code to an exit status."""
+    if result is None or result is True:
+        return 0
+    if result is False:
+        return 1
+    if isinstance(result, int):
+        return result
+    # sys.exit("message") prints the message and exits with status 1
+    print(result, file=sys.stderr)
+    return 1
+
+def run_process(module_name, script_path, args):
+    """Run a process script's main(argv) in-process and return its exit status.
+
+    Importing the module avoids starting a second interpreter; --subprocess
+    restores the old isolated behaviour. Raises FileNotFoundError if the
+    process script does not exist.
+    """
+    if USE_SUBPROCESS:
+        if not os.path.exists(script_path):
+            raise FileNotFoundError(script_path)
+        # Imported here so the common in-process path never loads subprocess
+        import subprocess
+        result = subprocess.run([sys.executable, script_path] + args)
+        return result.returncode
+    
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        # Only a missing process script counts as not found, not its imports
+        if e.name is None or not (module_name + ".").startswith(e.name + "."):
+            raise
+        raise FileNotFoundError(script_path) from None
+    try:
+        return exit_status(module.main(args))
+    except SystemExit as e:
+        return exit_status(e.code)
+
+def save_chat(args):
     """Real-time value capture system - no save process needed."""
-    print("=" * 60)
-    print("DATA CORE - REAL-TIME VALUE CAPTURE SYSTEM")
-    print("=" * 60)
-    print("The save process has been replaced with real-time value capture.")
-    print("AI automatically creates chat records when valuable content is identified.")
-    print("\nNo manual save process needed - system operates automatically.")
-    print("See MEMORY.md and chats/system/framework.md for details.")
-
-def validate_memory():
+    sys.stdout.write(SAVE_BANNER)
+
+def validate_memory(args):
     """Validate chat memory files using the validation process."""
-    print("=" * 60)
-    print("DATA CORE - MEMORY VALIDATION PROCESS")
-    print("=" * 60)
-    print("Validates chat memory files for format compliance and gapless history.")
-    print("Ensures zero information loss and perfect conversation continuity.")
-    print("\nStarting memory validation process...")
+    sys.stdout.write(VALIDATE_BANNER)
     
-    # Get memory file path
-    if len(sys.argv) < 4:
-        print("Error: Memory file path required")
-        print("Usage: python data_core.py validate memory --file <memory_file_path>")
-        return
+    # Call the validation process
+    try:
+        status = run_process("processes.chats.validate_memory", VALIDATE_MEMORY_SCRIPT, [args.file])
+        if status != 0:
+            print(f"Error: Memory validation failed with exit status {status}")
+    except FileNotFoundError:
+        print(f"Error: Validation script not found at {VALIDATE_MEMORY_SCRIPT}")
+
+def health_check(args):
+    """Run comprehensive health check using AI-first health monitoring process."""
+    sys.stdout.write(HEALTH_BANNER)
     
-    if sys.argv[3] != "--file":
-        print("Error: Invalid syntax")
-        print("Usage: python data_core.py validate memory --file <memory_file_path>")
-        return
+    # Pass live conversation context if available (optional for health checks);
+    # like the original positional parsing, only the first argument is used
+    context = args.context[0] if args.context else None
+    process_args = [context] if context else []
+    try:
+        status = run_process("processes.chats.chat_health_check", HEALTH_CHECK_SCRIPT, process_args)
+        if status != 0:
+            print(f"Error: Health check process failed with exit status {status}")
+    except FileNotFoundError:
+        print(f"Error: Health check script not found at {HEALTH_CHECK_SCRIPT}")
+
+def git_commit(args):
+    """Git commit functionality temporarily removed during system transformation."""
+    sys.stdout.write(COMMIT_BANNER)
+
+def print_help():
+    """Print the command overview shown when no command is given.
+
+    The text is only assembled on this path, not on every import.
+    """
+    sys.stdout.write("\n".join([
+        "Data Core System - Portfolio Building for Canadian Express Entry",
+        BAR,
+        "Available commands:",
+        "",
+        "📝 DATA OPERATIONS:",
+        "  python data_core.py save chat                    - Note: Replaced with real-time value capture",
+        "  python data_core.py validate memory --file <path> - Validate chat memory files",
+        "",
+        "🔍 HEALTH MONITORING:",
+        "  python data_core.py health [\"context\"]      - Comprehensive system health check",
+        "",
+        "🔐 GIT OPERATIONS:",
+        "  python data_core.py commit                   - Note: Temporarily removed during system transformation",
+        "",
+        "⚙️  OPTIONS:",
+        "  --subprocess                                 - Run processes in a separate Python interpreter",
+        "",
+        "📊 PROCESS DETAILS:",
+        "",
+        "Real-Time Value Capture System:",
+        "  ✓ AI automatically creates chat records when value is identified",
+        "  ✓ Framework v3.0 compliance with real-time capture",
+        "  ✓ No save process needed - immediate creation of records",
+        "  ✓ Learning system continuously improves capture quality",
+        "  ✓ Zero workflow disruption - natural conversation flow",
+        "  ✓ Gapless history maintained through validation",
+        "  ✓ Professional portfolio-ready documentation",
+        "",
+        "Memory Validation Process:",
+        "  ✓ Format compliance validation (User:/Assistant: pattern)",
+        "  ✓ Gapless history verification (continuous conversation)",
+        "  ✓ Content integrity checks (file corruption detection)",
+        "  ✓ Comprehensive error reporting with recovery guidance",
+        "  ✓ System strengthening recommendations after failures",
+        "",
+        "AI-First Health Check Process:",
+        "  ✓ Comprehensive chat system health monitoring",
+        "  ✓ Proactive issue detection and timeline validation",
+        "  ✓ Framework v3.0 compliance verification",
+        "  ✓ Live context alignment validation (optional)",
+        "  ✓ File integrity and continuity analysis",
+        "  ✓ Detailed reporting with actionable insights",
+        "  ✓ Dual-time display: local time with GMT reference for better UX",
+        "",
+    ]) + "\n")
+
+def build_parser():
+    """Build the command-line parser; handlers receive the parsed namespace."""
+    # Imported here so the no-argument help path never loads argparse
+    import argparse
     
-    memory_file_path = sys.argv[4]
+    parser = argparse.ArgumentParser(prog="data_core.py")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="run processes in a separate Python interpreter")
     
-    # Call the validation process
-    script_path = os.path.join("processes", "chats", "validate_memory.py")
-    if os.path.exists(script_path):
-        try:
-            result = subprocess.run([sys.executable, script_path, memory_file_path], 
-                                 check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error: Memory validation failed: {e}")
-    else:
-        print(f"Error: Validation script not found at {script_path}")
-
-def health_check():
-    """Run comprehensive health check using AI-first health monitoring process."""
-    print("=" * 60)
-    print("DATA CORE - AI-FIRST HEALTH CHECK PROCESS")
-    print("=" * 60)
-    print("Comprehensive chat system health monitoring with proactive issue detection.")
-    print("Zero manual intervention required - designed for AI systems.")
-    print("\nStarting AI-first health check process...")
+    # Also accept --subprocess after the command without resetting it
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument("--subprocess", action="store_true", default=argparse.SUPPRESS,
+                         help=argparse.SUPPRESS)
+    commands = parser.add_subparsers(dest="command", required=True)
     
-    # Get live conversation context if available (optional for health checks)
-    live_context = None
-    if len(sys.argv) >= 3:
-        live_context = sys.argv[2]
+    save = commands.add_parser("save", parents=[options], help="replaced with real-time value capture")
+    save.add_argument("target", choices=["chat"])
+    save.set_defaults(handler=save_chat)
     
-    # Call the AI-first health check process
-    script_path = os.path.join("processes", "chats", "chat_health_check.py")
-    if os.path.exists(script_path):
-        try:
-            if live_context:
-                result = subprocess.run([sys.executable, script_path, live_context], 
-                                     check=True)
-            else:
-                result = subprocess.run([sys.executable, script_path], 
-                                     check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error: Health check process failed: {e}")
-    else:
-        print(f"Error: Health check script not found at {script_path}")
-
-def git_commit():
-    """Git commit functionality temporarily removed during system transformation."""
-    print("=" * 60)
-    print("DATA CORE - GIT COMMIT PROCESS")
-    print("=" * 60)
-    print("Git commit functionality has been temporarily removed.")
-    print("Use standard git commands for now: git add, git commit, git push")
-    print("\nThis will be reimplemented when the new system architecture is ready.")
+    validate = commands.add_parser("validate", parents=[options], help="validate chat memory files")
+    validate.add_argument("target", choices=["memory"])
+    validate.add_argument("--file", required=True, metavar="PATH", help="memory file to validate")
+    validate.set_defaults(handler=validate_memory)
+    
+    commit = commands.add_parser("commit", parents=[options], help="temporarily removed")
+    commit.set_defaults(handler=git_commit)
+    
+    health = commands.add_parser("health", parents=[options], help="comprehensive system health check")
+    health.add_argument("context", nargs=argparse.REMAINDER,
+                        help="live conversation context (optional; extra arguments are ignored)")
+    health.set_defaults(handler=health_check)
+    
+    return parser
 
 def main():
-    if len(sys.argv) > 1:
-        if len(sys.argv) > 1 and sys.argv[1] == "save" and len(sys.argv) > 2 and sys.argv[2] == "chat":
-            print("Note: Save process replaced with real-time value capture. See MEMORY.md for details.")
-            save_chat()
-        elif len(sys.argv) > 2 and sys.argv[1] == "validate" and sys.argv[2] == "memory":
-            validate_memory()
-        elif sys.argv[1] == "commit":
-            git_commit()
-        elif sys.argv[1] == "health":
-            health_check()
-        else:
-            print("Unknown command")
-    else:
-        print("Data Core System - Portfolio Building for Canadian Express Entry")
-        print("=" * 60)
-        print("Available commands:")
-        print()
-        print("📝 DATA OPERATIONS:")
-        print("  python data_core.py save chat                    - Note: Replaced with real-time value capture")
-        print("  python data_core.py validate memory --file <path> - Validate chat memory files")
-        print()
-        print("🔍 HEALTH MONITORING:")
-        print("  python data_core.py health [\"context\"]      - Comprehensive system health check")
-        print()
-        print("🔐 GIT OPERATIONS:")
-        print("  python data_core.py commit                   - Note: Temporarily removed during system transformation")
-        print()
-        print("📊 PROCESS DETAILS:")
-        print()
-        print("Real-Time Value Capture System:")
-        print("  ✓ AI automatically creates chat records when value is identified")
-        print("  ✓ Framework v3.0 compliance with real-time capture")
-        print("  ✓ No save process needed - immediate creation of records")
-        print("  ✓ Learning system continuously improves capture quality")
-        print("  ✓ Zero workflow disruption - natural conversation flow")
-        print("  ✓ Gapless history maintained through validation")
-        print("  ✓ Professional portfolio-ready documentation")
-        print()
-        print("Memory Validation Process:")
-        print("  ✓ Format compliance validation (User:/Assistant: pattern)")
-        print("  ✓ Gapless history verification (continuous conversation)")
-        print("  ✓ Content integrity checks (file corruption detection)")
-        print("  ✓ Comprehensive error reporting with recovery guidance")
-        print("  ✓ System strengthening recommendations after failures")
-        print()
-        print("AI-First Health Check Process:")
-        print("  ✓ Comprehensive chat system health monitoring")
-        print("  ✓ Proactive issue detection and timeline validation")
-        print("  ✓ Framework v3.0 compliance verification")
-        print("  ✓ Live context alignment validation (optional)")
-        print("  ✓ File integrity and continuity analysis")
-        print("  ✓ Detailed reporting with actionable insights")
-        print("  ✓ Dual-time display: local time with GMT reference for better UX")
-        print()
-
+    global USE_SUBPROCESS
+    if len(sys.argv) == 1:
+        print_help()
+        return
+    
+    parser = build_parser()
+    args, extras = parser.parse_known_args(sys.argv[1:])
+    # Leftover words are ignored by save and commit, as before argparse
+    if args.command == "health":
+        # Dash-prefixed tokens before the context land in extras (e.g. "health -v"),
+        # and REMAINDER also captures a --subprocess given after the context
+        context = extras + args.context
+        if "--subprocess" in context:
+            args.subprocess = True
+            context = [arg for arg in context if arg != "--subprocess"]
+        args.context = context
+    elif args.command == "validate" and extras:
+        parser.error(f"unrecognized arguments: {' '.join(extras)}")
+    USE_SUBPROCESS = args.subprocess
+    args.handler(args)
 
 if __name__ == "__main__":
     main()
@@ -5,16 +5,49 @@ Continuously monitors chat system health with comprehensive validation and repor
 Follows Data Core System principles: zero information loss, data immutability, proactive monitoring.
 """
 
+import codecs
+import heapq
+import io
 import os
+import re
 import sys
-from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Tuple, Optional
 
+# Markers a Framework v1.1 chat file must contain; the version marker
+# lives in the YAML frontmatter, so only that much of the file is searched
+FRAMEWORK_MARKER = "framework_version: 1.1"
+FRONTMATTER_CHARS = 2048
+REQUIRED_SECTIONS = [
+    "## Summary", "## Key Insights", "## Decisions Made", "## Questions Answered",
+    "## Action Items", "## Context", "## Personal Reflections", "## System State",
+    "## Implementation Details", "## Current Status", "## Additional Notes", "## Technical Specifications"
+]
+
+# Chat filenames are zero-padded, so name order is chronological order
+CHAT_FILENAME_RE = re.compile(r'chat-(\d{4})-(\d{2})-(\d{2})-(\d{2})-(\d{2})\.md$')
+
+# Words of six or more characters count as meaningful for context alignment
+MEANINGFUL_WORD_RE = re.compile(r'\w{6,}')
+
+# Sections sit near the top of a chat file; only the head of larger files is
+# read unless a section is missing from it
+HEAD_BYTES = 64 * 1024
+
+# Chat files smaller than this are rejected without reading their content
+MIN_CHAT_BYTES = 1000
+
+# Piped conversation context beyond this size is ignored
+MAX_CONTEXT_BYTES = 16 * 1024 * 1024
+
 def get_current_gmt_time():
     """Get current GMT time for timestamps."""
     return datetime.now(timezone.utc)
 
-def auto_extract_context_if_available():
+def auto_extract_context_if_available(argv: List[str]):
     """
     AUTO-EXTRACT conversation context if available for enhanced validation.
     This is optional for health checks - system can validate without it.
@@ -23,8 +56,8 @@ def auto_extract_context_if_available():
     
     try:
         # Method 1: Check if conversation context was passed as argument
-        if len(sys.argv) > 1:
-            context = sys.argv[1]
+        if argv:
+            context = argv[0]
             print(f"    ✓ Live conversation context found ({len(context)} chars)")
             return context
             
@@ -36,9 +69,17 @@ def auto_extract_context_if_available():
             
         # Method 3: Attempt to read from stdin (for piped input)
         if not sys.stdin.isatty():
-            context = sys.stdin.read().strip()
+            # Read raw bytes with a cap instead of the whole stream as text;
+            # one extra byte tells input over the cap from input exactly at it
+            data = sys.stdin.buffer.read(MAX_CONTEXT_BYTES + 1)
+            truncated = len(data) > MAX_CONTEXT_BYTES
+            if truncated:
+                data = data[:MAX_CONTEXT_BYTES]
+            context = data.decode('utf-8', 'replace').strip()
             if context:
                 print(f"    ✓ Conversation context read from stdin ({len(context)} chars)")
+                if truncated:
+                    print(f"    ⚠ Stdin context truncated to the first {MAX_CONTEXT_BYTES} bytes")
                 return context
         
         # No context available - this is fine for health checks
@@ -53,19 +94,19 @@ def validate_chats_directory(chats_dir: str) -> Tuple[bool, str]:
     """Validate chats directory exists and is accessible."""
     print("  Validating chats directory structure...")
     
-    if not os.path.exists(chats_dir):
+    try:
+        # Opening the directory checks existence, type and read access in
+        # one call, without listing its entries
+        with os.scandir(chats_dir):
+            pass
+        print(f"    ✓ Chats directory validated: {chats_dir}")
+        return True, f"Directory accessible at {chats_dir}"
+    except FileNotFoundError:
         print(f"    ✗ Chats directory not found: {chats_dir}")
         return False, f"Chats directory not found: {chats_dir}"
-    
-    if not os.path.isdir(chats_dir):
+    except NotADirectoryError:
         print(f"    ✗ Chats path is not a directory: {chats_dir}")
         return False, f"Chats path is not a directory: {chats_dir}"
-    
-    try:
-        # Test read access
-        os.listdir(chats_dir)
-        print(f"    ✓ Chats directory validated: {chats_dir}")
-        return True, f"Directory accessible at {chats_dir}"
     except PermissionError:
         print(f"    ✗ Permission denied accessing: {chats_dir}")
         return False, f"Permission denied accessing: {chats_dir}"
@@ -73,31 +114,57 @@ def validate_chats_directory(chats_dir: str) -> Tuple[bool, str]:
         print(f"    ✗ Error accessing directory: {e}")
         return False, f"Error accessing directory: {e}"
 
-def discover_chat_files(chats_dir: str) -> Tuple[bool, List[str], str]:
-    """Discover and validate chat files in the directory."""
+def discover_chat_files(chats_dir: str, limit: Optional[int] = None) -> Tuple[bool, List[os.DirEntry], str]:
+    """
+    Discover and validate chat files in the directory.
+    Returns the newest files first, at most limit of them if given.
+    """
     print("  Discovering chat files...")
     
     try:
-        all_files = os.listdir(chats_dir)
-        chat_files = [f for f in all_files if f.startswith("chat-") and f.endswith(".md")]
+        # scandir entries carry the file type and path from the directory read
+        with os.scandir(chats_dir) as entries:
+            chat_files = [e for e in entries
+                          if e.name.startswith("chat-") and e.name.endswith(".md") and e.is_file()]
         
         if not chat_files:
             print("    ✗ No chat files found matching pattern chat-*.md")
             return False, [], "No chat files found"
         
-        # Sort chronologically (newest first for health check focus)
-        chat_files.sort(reverse=True)
-        print(f"    ✓ Discovered {len(chat_files)} chat files")
+        # Sort chronologically (newest first for health check focus); with a
+        # limit only the newest entries are selected instead of sorting all
+        total = len(chat_files)
+        if limit is None:
+            chat_files.sort(key=lambda e: e.name, reverse=True)
+        else:
+            chat_files = heapq.nlargest(limit, chat_files, key=lambda e: e.name)
+        print(f"    ✓ Discovered {total} chat files")
         
-        return True, chat_files, f"Found {len(chat_files)} chat files"
+        return True, chat_files, f"Found {total} chat files"
         
     except Exception as e:
         print(f"    ✗ Error discovering files: {e}")
         return False, [], f"Discovery error: {e}"
 
-def analyze_chat_file(filepath: str, filename: str) -> Dict:
-    """Analyze a single chat file with comprehensive validation."""
-    print(f"    Analyzing {filename}...")
+def read_chat_content(entry: os.DirEntry, size: int) -> str:
+    """Read the head of a chat file, or all of it if the head lacks a section."""
+    with open(entry.path, 'rb') as f:
+        data = f.read(HEAD_BYTES)
+        if size > len(data):
+            if not all(section.encode() in data for section in REQUIRED_SECTIONS):
+                data += f.read()
+    # Invalid UTF-8 raises and marks the file invalid; only a multi-byte
+    # character cut off at the end of a partial head read is tolerated
+    return codecs.getincrementaldecoder('utf-8')().decode(data, final=len(data) >= size)
+
+def analyze_chat_file(entry: os.DirEntry, log: Optional[List[str]] = None) -> Dict:
+    """
+    Analyze a single chat file with comprehensive validation.
+    Progress lines go to log when given (for parallel runs), otherwise to stdout.
+    """
+    emit = print if log is None else log.append
+    filename = entry.name
+    emit(f"    Analyzing {filename}...")
     
     analysis = {
         'filename': filename,
@@ -111,125 +178,118 @@ def analyze_chat_file(filepath: str, filename: str) -> Dict:
     }
     
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-        
-        analysis['size'] = len(content)
+        # Size comes from the directory entry's stat, not the bytes read
+        size = entry.stat().st_size
+        analysis['size'] = size
         
         # Parse timestamp from filename
         timestamp = parse_temporal_filename(filename)
         if timestamp:
             analysis['timestamp'] = timestamp
-            print(f"      ✓ Timestamp parsed: {timestamp.strftime('%Y-%m-%d %H:%M')} GMT")
+            emit(f"      ✓ Timestamp parsed: {timestamp.strftime('%Y-%m-%d %H:%M')} GMT")
         else:
             analysis['issues'].append("Invalid timestamp format in filename")
             analysis['valid'] = False
-            print(f"      ✗ Invalid timestamp format")
+            emit(f"      ✗ Invalid timestamp format")
         
-        # Check file size
-        if len(content) < 1000:
-            analysis['issues'].append(f"File too small ({len(content)} chars) - minimum 1000 expected")
+        # Check file size; undersized files are rejected without being opened
+        if size < MIN_CHAT_BYTES:
+            analysis['issues'].append(f"File too small ({size} bytes) - minimum {MIN_CHAT_BYTES} expected")
             analysis['valid'] = False
-            print(f"      ✗ File too small: {len(content)} characters")
-        else:
-            print(f"      ✓ File size adequate: {len(content)} characters")
+            emit(f"      ✗ File too small: {size} bytes")
+            emit(f"      ✗ Analysis complete - {len(analysis['issues'])} issues found")
+            return analysis
+        emit(f"      ✓ File size adequate: {size} bytes")
+        
+        content = read_chat_content(entry, size)
         
         # Check Framework v1.1 compliance
-        if "framework_version: 1.1" in content:
+        if FRAMEWORK_MARKER in content[:FRONTMATTER_CHARS]:
             analysis['framework_compliant'] = True
-            print("      ✓ Framework v1.1 compliant")
+            emit("      ✓ Framework v1.1 compliant")
         else:
             analysis['issues'].append("Missing Framework v1.1 compliance")
             analysis['valid'] = False
-            print("      ✗ Not Framework v1.1 compliant")
+            emit("      ✗ Not Framework v1.1 compliant")
         
         # Count required sections
-        required_sections = [
-            "## Summary", "## Key Insights", "## Decisions Made", "## Questions Answered",
-            "## Action Items", "## Context", "## Personal Reflections", "## System State",
-            "## Implementation Details", "## Current Status", "## Additional Notes", "## Technical Specifications"
-        ]
-        
-        sections_found = sum(1 for section in required_sections if section in content)
+        sections_found = sum(1 for section in REQUIRED_SECTIONS if section in content)
         analysis['sections_found'] = sections_found
         
         if sections_found >= 12:  # All sections present
-            print(f"      ✓ All required sections present ({sections_found}/12)")
+            emit(f"      ✓ All required sections present ({sections_found}/12)")
         else:
             missing_count = 12 - sections_found
             analysis['issues'].append(f"Missing {missing_count} required Framework v1.1 sections")
             analysis['valid'] = False
-            print(f"      ✗ Missing sections: {sections_found}/12 found")
+            emit(f"      ✗ Missing sections: {sections_found}/12 found")
         
         # Extract summary for timeline
         analysis['summary'] = extract_summary_from_content(content)
         
         if analysis['valid']:
-            print(f"      ✓ Analysis complete - file validated")
+            emit(f"      ✓ Analysis complete - file validated")
         else:
-            print(f"      ✗ Analysis complete - {len(analysis['issues'])} issues found")
+            emit(f"      ✗ Analysis complete - {len(analysis['issues'])} issues found")
             
     except Exception as e:
         analysis['valid'] = False
         analysis['issues'].append(f"Error reading file: {e}")
-        print(f"      ✗ Error analyzing file: {e}")
+        emit(f"      ✗ Error analyzing file: {e}")
     
     return analysis
 
+@lru_cache(maxsize=4096)
 def parse_temporal_filename(filename: str) -> Optional[datetime]:
     """Parse timestamp from filename format: chat-YYYY-MM-DD-HH-MM.md"""
+    match = CHAT_FILENAME_RE.match(filename)
+    if not match:
+        return None
     try:
-        # Remove .md extension and split on hyphens
-        parts = filename.replace('.md', '').split('-')
-        if len(parts) >= 5 and parts[0] == 'chat':
-            year, month, day, hour, minute = parts[1:6]
-            return datetime(int(year), int(month), int(day), int(hour), int(minute), tzinfo=timezone.utc)
-    except (ValueError, IndexError):
-        pass
-    return None
+        return datetime(*map(int, match.groups()), tzinfo=timezone.utc)
+    except ValueError:  # Well-formed but impossible date, e.g. month 13
+        return None
+
+def extract_section_text(content: str, heading: str) -> str:
+    """Extract whitespace-normalized text between a heading and the next '##'."""
+    # A single find locates the heading; no separate 'in' pre-check
+    start = content.find(heading)
+    if start == -1:
+        return ''
+    start += len(heading)
+    end = content.find('##', start)
+    if end == -1:
+        end = start + 300  # Allow more content for better verification
+    return ' '.join(content[start:end].split())  # Normalize whitespace
 
 def extract_summary_from_content(content: str) -> str:
     """Extract comprehensive summary from file content for timeline verification."""
     try:
         # Try to extract the Summary section first (most reliable)
-        if '## Summary' in content:
-            start = content.find('## Summary') + len('## Summary')
-            end = content.find('##', start)
-            if end == -1:
-                end = start + 300  # Allow more content for better verification
-            summary = content[start:end].strip()
-            
-            # Clean up the summary content
-            summary = ' '.join(summary.split())  # Normalize whitespace
-            
-            if len(summary) > 20:  # If we got meaningful content
-                return summary
+        summary = extract_section_text(content, '## Summary')
+        if len(summary) > 20:  # If we got meaningful content
+            return summary
         
         # Fallback: Try to extract from Key Insights if Summary is empty
-        if '## Key Insights' in content:
-            start = content.find('## Key Insights') + len('## Key Insights')
-            end = content.find('##', start)
-            if end == -1:
-                end = start + 300
-            insights = content[start:end].strip()
-            insights = ' '.join(insights.split())
-            
-            if len(insights) > 20:
-                return f"Key Insights: {insights}"
+        insights = extract_section_text(content, '## Key Insights')
+        if len(insights) > 20:
+            return f"Key Insights: {insights}"
         
         # Final fallback: Try to extract from the beginning of content after metadata
-        lines = content.split('\n')
+        # Lines are read lazily so the scan stops once enough text is collected
         content_started = False
         extracted_lines = []
+        extracted_length = -1  # Length of ' '.join(extracted_lines)
         
-        for line in lines:
+        for line in io.StringIO(content):
             line = line.strip()
             if line.startswith('#') and not line.startswith('##'):  # Found main title
                 content_started = True
                 continue
             elif content_started and line and not line.startswith('#'):
                 extracted_lines.append(line)
-                if len(' '.join(extracted_lines)) > 200:
+                extracted_length += len(line) + 1
+                if extracted_length > 200:
                     break
         
         if extracted_lines:
@@ -255,21 +315,23 @@ def validate_timeline_continuity(analyses: List[Dict]) -> Tuple[bool, List[str]]
     
     issues = []
     
-    # Check for gaps between consecutive files
+    # Check for gaps between consecutive files, comparing POSIX timestamps
+    # directly instead of building a timedelta per pair
+    epochs = [a['timestamp'].timestamp() for a in valid_analyses]
     for i in range(len(valid_analyses) - 1):
         current = valid_analyses[i]
         next_file = valid_analyses[i + 1]
         
-        time_diff = next_file['timestamp'] - current['timestamp']
+        gap_seconds = epochs[i + 1] - epochs[i]
         
         # Check for overlaps (impossible timestamps)
-        if time_diff.total_seconds() < 0:
+        if gap_seconds < 0:
             issues.append(f"Timeline overlap: {current['filename']} after {next_file['filename']}")
             print(f"    ✗ Timeline overlap detected")
         
         # Check for large gaps (>6 hours suggests missing sessions)
-        elif time_diff.total_seconds() > 21600:  # 6 hours
-            hours = time_diff.total_seconds() / 3600
+        elif gap_seconds > 21600:  # 6 hours
+            hours = gap_seconds / 3600
             issues.append(f"Large gap: {hours:.1f} hours between {current['filename']} and {next_file['filename']}")
             print(f"    ⚠ Large gap detected: {hours:.1f} hours")
     
@@ -278,8 +340,12 @@ def validate_timeline_continuity(analyses: List[Dict]) -> Tuple[bool, List[str]]
     
     return len(issues) == 0, issues
 
-def validate_against_live_context(analyses: List[Dict], live_context: str) -> Tuple[bool, List[str]]:
-    """Validate recent analyses against live conversation context."""
+def validate_against_live_context(analyses: List[Dict], live_context: str,
+                                  now: Optional[datetime] = None) -> Tuple[bool, List[str]]:
+    """
+    Validate recent analyses against live conversation context.
+    Recency is measured from now, which defaults to the current GMT time.
+    """
     print("  Validating against live conversation context...")
     
     if not live_context:
@@ -294,37 +360,35 @@ def validate_against_live_context(analyses: List[Dict], live_context: str) -> Tu
     
     # Check if this might be a continuing session
     recent_files = analyses[:2] if len(analyses) > 1 else analyses  # Check first 2 files (most recent)
-    current_time = get_current_gmt_time()
+    current_time = now or get_current_gmt_time()
     
     # Check temporal alignment
     if recent_files:
         latest_timestamp = max(a['timestamp'] for a in recent_files if a['timestamp'])
-        time_since_latest = current_time - latest_timestamp
+        seconds_since_latest = (current_time - latest_timestamp).total_seconds()
         
         # If latest file is very recent (< 2 hours), expect some content alignment
-        if time_since_latest.total_seconds() < 7200:  # 2 hours
+        if seconds_since_latest < 7200:  # 2 hours
             # Display time difference in user-friendly format
-            minutes_ago = time_since_latest.total_seconds() / 60
-            if minutes_ago < 60:
-                time_display = f"{minutes_ago:.0f} minutes ago"
+            if seconds_since_latest < 3600:
+                time_display = f"{seconds_since_latest / 60:.0f} minutes ago"
             else:
-                hours_ago = time_since_latest.total_seconds() / 3600
-                time_display = f"{hours_ago:.1f}h ago"
+                time_display = f"{seconds_since_latest / 3600:.1f}h ago"
             print(f"    ⚠ Recent session detected ({time_display})")
             
             # Look for any content overlap (soft validation)
-            live_lower = live_context.lower()
+            # Tokenize the live context once; each summary word is then a set
+            # lookup instead of a substring scan of the whole context
+            live_words = set(MEANINGFUL_WORD_RE.findall(live_context.lower()))
             content_found = False
             
             for analysis in recent_files:
                 if analysis['summary']:
-                    summary_words = [w for w in analysis['summary'].lower().split() if len(w) > 5]
-                    for word in summary_words[:5]:  # Check first few meaningful words
-                        if word in live_lower:
-                            content_found = True
-                            break
-                if content_found:
-                    break
+                    # Only the first few meaningful words are tokenized
+                    summary_words = islice(MEANINGFUL_WORD_RE.finditer(analysis['summary'].lower()), 5)
+                    if any(match.group() in live_words for match in summary_words):
+                        content_found = True
+                        break
             
             if not content_found:
                 issues.append("Recent chat files don't appear to reflect current conversation context")
@@ -350,13 +414,30 @@ def generate_comprehensive_report(analyses: List[Dict], timeline_issues: List[st
             'summary': 'No data available'
         }
     
-    # Calculate statistics
-    valid_files = [a for a in analyses if a['valid']]
-    invalid_files = [a for a in analyses if not a['valid']]
+    # Calculate statistics, issues and time bounds in a single pass
+    valid_count = 0
+    invalid_count = 0
+    framework_count = 0
+    all_issues = []
+    timestamps = []
+    for analysis in analyses:
+        if analysis['valid']:
+            valid_count += 1
+        else:
+            invalid_count += 1
+            for issue in analysis['issues']:
+                all_issues.append(f"{analysis['filename']}: {issue}")
+        if analysis.get('framework_compliant', False):
+            framework_count += 1
+        if analysis['timestamp']:
+            timestamps.append(analysis['timestamp'])
+    
+    all_issues.extend(timeline_issues)
+    all_issues.extend(context_issues)
     
     # Generate timeline (most recent files first)
     timeline = []
-    for analysis in analyses[:5]:  # Show 5 most recent
+    for analysis in islice(analyses, 5):  # Show 5 most recent
         if analysis['timestamp']:
             timeline.append({
                 'timestamp': analysis['timestamp'],
@@ -366,49 +447,37 @@ def generate_comprehensive_report(analyses: List[Dict], timeline_issues: List[st
                 'size': analysis['size']
             })
     
-    # Collect all issues
-    all_issues = []
-    for analysis in invalid_files:
-        for issue in analysis['issues']:
-            all_issues.append(f"{analysis['filename']}: {issue}")
-    
-    all_issues.extend(timeline_issues)
-    all_issues.extend(context_issues)
-    
     # Calculate time span (display in local time for user readability)
-    timestamps = [a['timestamp'] for a in analyses if a['timestamp']]
     time_span = "Unknown"
     duration = "Unknown"
     
     if timestamps:
-        timestamps.sort()
-        earliest = timestamps[0]
-        latest = timestamps[-1]
+        earliest = min(timestamps)
+        latest = max(timestamps)
         
         # Convert to local time for display
         earliest_local = earliest.replace(tzinfo=timezone.utc).astimezone()
         latest_local = latest.replace(tzinfo=timezone.utc).astimezone()
         time_span = f"{earliest_local.strftime('%H:%M')} - {latest_local.strftime('%H:%M')} (local)"
         
-        diff = latest - earliest
-        if diff.total_seconds() < 3600:
-            duration = f"{int(diff.total_seconds() / 60)} minutes"
+        hours, seconds = divmod(int((latest - earliest).total_seconds()), 3600)
+        minutes = seconds // 60
+        if hours == 0:
+            duration = f"{minutes} minutes"
         else:
-            hours = int(diff.total_seconds() / 3600)
-            minutes = int((diff.total_seconds() % 3600) / 60)
             duration = f"{hours}h {minutes}m"
     
     # Determine overall health
-    healthy = (len(valid_files) == len(analyses) and 
+    healthy = (valid_count == len(analyses) and 
               len(timeline_issues) == 0 and 
               len(context_issues) == 0)
     
     report = {
         'healthy': healthy,
         'total_files': len(analyses),
-        'valid_files': len(valid_files),
-        'invalid_files': len(invalid_files),
-        'framework_compliant': sum(1 for a in analyses if a.get('framework_compliant', False)),
+        'valid_files': valid_count,
+        'invalid_files': invalid_count,
+        'framework_compliant': framework_count,
         'issues': all_issues,
         'timeline': timeline,
         'summary': {
@@ -424,26 +493,29 @@ def generate_comprehensive_report(analyses: List[Dict], timeline_issues: List[st
 
 def display_health_results(report: Dict) -> None:
     """Display comprehensive health check results."""
-    print("  Displaying comprehensive health results...")
+    # Lines are collected and written in one call at the end
+    lines = []
+    emit = lines.append
+    emit("  Displaying comprehensive health results...")
     
     # Summary Statistics
-    print(f"\n    📊 HEALTH SUMMARY:")
-    print(f"       Files analyzed: {report['total_files']}")
-    print(f"       Valid files: {report['valid_files']}")
+    emit(f"\n    📊 HEALTH SUMMARY:")
+    emit(f"       Files analyzed: {report['total_files']}")
+    emit(f"       Valid files: {report['valid_files']}")
     if report['invalid_files'] > 0:
-        print(f"       Invalid files: {report['invalid_files']}")
-    print(f"       Framework v1.1 compliant: {report['framework_compliant']}")
+        emit(f"       Invalid files: {report['invalid_files']}")
+    emit(f"       Framework v1.1 compliant: {report['framework_compliant']}")
     
     if report['summary']:
-        print(f"       Time span: {report['summary']['time_span']}")
-        print(f"       Total duration: {report['summary']['total_duration']}")
-        print(f"       Status: {report['summary']['health_status']}")
+        emit(f"       Time span: {report['summary']['time_span']}")
+        emit(f"       Total duration: {report['summary']['total_duration']}")
+        emit(f"       Status: {report['summary']['health_status']}")
     
     # Detailed Recent Timeline for User Verification
     if report['timeline']:
-        print(f"\n    📅 DETAILED TIMELINE - LAST 5 RECORDS:")
-        print(f"       (Showing detailed content for manual verification)")
-        print()
+        emit(f"\n    📅 DETAILED TIMELINE - LAST 5 RECORDS:")
+        emit(f"       (Showing detailed content for manual verification)")
+        emit("")
         
         for i, item in enumerate(report['timeline'], 1):
             status = "✅" if item['valid'] else "❌"
@@ -453,28 +525,38 @@ def display_health_results(report: Dict) -> None:
             gmt_timestamp = item['timestamp']
             local_timestamp = gmt_timestamp.replace(tzinfo=timezone.utc).astimezone()
             timestamp_display = f"{local_timestamp.strftime('%H:%M')} (GMT: {gmt_timestamp.strftime('%H:%M')})"
-            size = f"{item['size']} chars"
+            size = f"{item['size']} bytes"
             
             # Show more detailed summary (up to 200 chars for better context)
             summary = item['summary']
-            if len(summary) > 200:
+            if not summary and item['size'] < MIN_CHAT_BYTES:
+                # Undersized files are never read, so they have no summary
+                summary = "Content not analyzed - file below minimum size"
+            elif len(summary) > 200:
                 summary = summary[:200] + '...'
             
-            print(f"       {i}. {status} {timestamp_display} ({size})")
-            print(f"          {summary}")
-            print()
+            emit(f"       {i}. {status} {timestamp_display} ({size})")
+            emit(f"          {summary}")
+            emit("")
     
     # Issues Found
     if report['issues']:
-        print(f"    ⚠️  ISSUES DETECTED:")
+        emit(f"    ⚠️  ISSUES DETECTED:")
         for issue in report['issues']:
-            print(f"       - {issue}")
-        print()
+            emit(f"       - {issue}")
+        emit("")
     
-    print("    ✓ Detailed health results displayed for manual verification")
+    emit("    ✓ Detailed health results displayed for manual verification")
+    sys.stdout.write("".join(line + "\n" for line in lines))
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main AI-first health check process."""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Anchor all relative-time checks in this run to one instant
+    run_started = get_current_gmt_time()
+    
     print("=" * 70)
     print("CHAT HEALTH CHECK PROCESS - AI-FIRST SYSTEM MONITORING")
     print("=" * 70)
@@ -500,7 +582,7 @@ def main():
     print("STEP 2: AUTO-EXTRACT CONVERSATION CONTEXT (OPTIONAL)")
     print("=" * 70)
     
-    live_context = auto_extract_context_if_available()
+    live_context = auto_extract_context_if_available(argv)
     print("✓ Context extraction complete")
     
     # Step 3: File discovery
@@ -508,7 +590,7 @@ def main():
     print("STEP 3: CHAT FILE DISCOVERY")
     print("=" * 70)
     
-    files_found, chat_files, discovery_message = discover_chat_files(chats_dir)
+    files_found, chat_files, discovery_message = discover_chat_files(chats_dir, limit=10)
     if not files_found:
         print("✗ CRITICAL: No chat files found for health monitoring")
         print(f"  Issue: {discovery_message}")
@@ -521,11 +603,12 @@ def main():
     print("STEP 4: COMPREHENSIVE FILE ANALYSIS")
     print("=" * 70)
     
-    analyses = []
-    for filename in chat_files[:10]:  # Analyze 10 most recent files
-        filepath = os.path.join(chats_dir, filename)
-        analysis = analyze_chat_file(filepath, filename)
-        analyses.append(analysis)
+    # Analyze the 10 most recent files; reads overlap across threads and each
+    # file's progress is written in order, in one call, once all analyses finish
+    logs = [[] for _ in chat_files]
+    with ThreadPoolExecutor(max_workers=min(8, len(chat_files))) as executor:
+        analyses = list(executor.map(analyze_chat_file, chat_files, logs))
+    sys.stdout.write("".join(line + "\n" for log in logs for line in log))
     
     print(f"✓ File analysis complete - {len(analyses)} files analyzed")
     
@@ -545,7 +628,7 @@ def main():
     print("STEP 6: LIVE CONTEXT VALIDATION")
     print("=" * 70)
     
-    context_valid, context_issues = validate_against_live_context(analyses, live_context)
+    context_valid, context_issues = validate_against_live_context(analyses, live_context, now=run_started)
     if context_valid:
         print("✓ Live context validation complete")
     else: